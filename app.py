@@ -4,18 +4,18 @@ Interactive dashboard for exploring NCAA baseball programs with academic and ath
 """
 
 import dash
-from dash import dcc, html, Input, Output, State, dash_table
+from dash import dcc, html, Input, Output, State, Patch, dash_table
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
 import numpy as np
-from geopy.distance import geodesic
 import json
 import requests
 import os
 from dotenv import load_dotenv
 import time
+from functools import lru_cache
 
 # Firebase imports
 from auth_components import (
@@ -31,6 +31,13 @@ load_dotenv()
 COLLEGE_SCORECARD_API_KEY = os.getenv('COLLEGE_SCORECARD_API_KEY')
 COLLEGE_SCORECARD_API_URL = 'https://api.data.gov/ed/collegescorecard/v1/schools'
 
+# Compress layout and callback responses when flask-compress is installed
+try:
+    import flask_compress  # noqa: F401
+    COMPRESS_RESPONSES = True
+except ImportError:
+    COMPRESS_RESPONSES = False
+
 # Initialize the Dash app
 app = dash.Dash(
     __name__,
@@ -38,7 +45,8 @@ app = dash.Dash(
         dbc.themes.BOOTSTRAP,
         "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css"
     ],
-    suppress_callback_exceptions=True
+    suppress_callback_exceptions=True,
+    compress=COMPRESS_RESPONSES
 )
 
 # Expose Flask server for Gunicorn
@@ -55,15 +63,80 @@ input_data = pd.read_csv('input_filtered.csv')
 climate_data = pd.read_csv('climate_data_processed.csv')
 climate_monthly = pd.read_csv('climate_data_monthly_long.csv')
 roster_data = pd.read_csv('combined_ncaa_rosters_filtered.csv')
-roster_data_full = pd.read_csv('combined_ncaa_rosters.csv')  # Full roster with positions
-team_history = pd.read_csv('ncaa_team_history_updated.csv')
-coach_metrics = pd.read_csv('team_coach_metrics.csv')
+# Class labels repeat across ~150k rows - strip once and keep them as a categorical
+roster_data['class'] = roster_data['class'].str.strip().astype('category')
+# Only load the columns the dashboard actually uses from the wide files
+team_history = pd.read_csv(
+    'ncaa_team_history_updated.csv',
+    usecols=['prev_team_id', 'Year', 'WL_pct']
+)
+coach_metrics = pd.read_csv(
+    'team_coach_metrics.csv',
+    usecols=['prev_team_id', 'Year', 'Head_Coach', 'Wins_At_Team', 'Losses_At_Team',
+             'Seasons_At_Team', 'Coach_Stats_URL']
+)
+
+POSITION_GROUPS = ['P', 'C', 'IF', 'OF']
+
+def classify_positions(positions):
+    """Map raw roster positions to P/C/IF/OF groups (first match wins, anything else is OTHER)"""
+    pos = positions.astype(str).str.strip().str.upper()
+    groups = np.select(
+        [
+            # Pitchers: P, RHP, LHP, etc.
+            pos.str.contains('P', regex=False) & (pos != 'DH'),
+            # Catchers
+            pos == 'C',
+            # Infielders: 1B, 2B, 3B, SS, IF, INF
+            pos.str.contains('1B|2B|3B|SS|IF|INF') & ~pos.str.contains('OF', regex=False),
+            # Outfielders: OF, LF, CF, RF
+            pos.str.contains('OF|LF|CF|RF')
+        ],
+        POSITION_GROUPS,
+        default='OTHER'
+    )
+    return pd.Categorical(groups, categories=POSITION_GROUPS + ['OTHER'])
+
+@lru_cache(maxsize=1)
+def get_roster_data_full():
+    """Full roster with positions - only needed by the team metrics modal, so load on first use"""
+    roster_data_full = pd.read_csv(
+        'combined_ncaa_rosters.csv',
+        usecols=['prev_team_id', 'year', 'position'],
+        dtype={'position': 'category'}
+    )
+    roster_data_full['position_group'] = classify_positions(roster_data_full['position'])
+    return roster_data_full
+
+@lru_cache(maxsize=1)
+def get_roster_2025_by_team():
+    """2025 full-roster rows keyed by prev_team_id, built on first use"""
+    roster_data_full = get_roster_data_full()
+    roster_2025 = roster_data_full[roster_data_full['year'] == 2025]
+    return {tid: group for tid, group in roster_2025.groupby('prev_team_id', sort=False)}
+
+# Parse team history once: "2024-25" -> 2025 (the year the season ends), WL_pct as a float,
+# dropping seasons without a valid win% (winless seasons stay) and sorting each team by year
+team_history['Year'] = team_history['Year'].astype(str).str.split('-').str[0].astype(int) + 1
+team_history['WL_pct'] = pd.to_numeric(team_history['WL_pct'], errors='coerce')
+team_history = team_history[team_history['WL_pct'].notna()].sort_values(['prev_team_id', 'Year'])
+
+# Per-team slices keyed by prev_team_id so the roster metrics don't rescan the full frames
+# (team history is kept as (years, win%) arrays, already sorted by year)
+TEAM_HISTORY_BY_TID = {
+    tid: (group['Year'].to_numpy(), group['WL_pct'].to_numpy())
+    for tid, group in team_history.groupby('prev_team_id', sort=False)
+}
+ROSTER_BY_TID = {tid: group for tid, group in roster_data.groupby('prev_team_id', sort=False)}
+# Current (2026) head coach row per team - the first listed when a team has several
+current_coaches = coach_metrics[coach_metrics['Year'] == 2026].drop_duplicates('prev_team_id')
+CURRENT_COACH_BY_TID = dict(zip(current_coaches['prev_team_id'], current_coaches.to_dict('records')))
 
 # Merge climate data
 merged_data = input_data.merge(climate_data, on='unitid', how='left')
 
-# Filter out rows without location data
-merged_data = merged_data.dropna(subset=['latitude', 'longitude'])
+# Filter out rows without location data (renumbering so index labels match row positions)
+merged_data = merged_data.dropna(subset=['latitude', 'longitude']).reset_index(drop=True)
 
 # Calculate derived fields
 merged_data['win_pct'] = np.where(
@@ -74,6 +147,62 @@ merged_data['win_pct'] = np.where(
 merged_data['accept_rate_pct'] = (merged_data['adm_rate'] * 100).round(1)
 merged_data['sat_score'] = merged_data['sat_avg'].fillna(0)
 
+# Downcast integer columns and store repeated labels as categoricals to shrink the frame
+# (float columns stay float64 so displayed values and slider bounds compare exactly)
+int_cols = merged_data.select_dtypes(include='int64').columns
+merged_data[int_cols] = merged_data[int_cols].apply(pd.to_numeric, downcast='integer')
+for col in ['Conference_Name', 'state_abbr', 'control', 'region', 'locale', 'relaffil']:
+    merged_data[col] = merged_data[col].astype('category')
+
+# School coordinates in radians (and cos of latitude) for the vectorized distance filter
+SCHOOL_LAT_RAD = np.radians(merged_data['latitude'].to_numpy())
+SCHOOL_LON_RAD = np.radians(merged_data['longitude'].to_numpy())
+SCHOOL_COS_LAT = np.cos(SCHOOL_LAT_RAD)
+
+# Numeric filter columns as plain float arrays (NaN never passes a range check)
+SCHOOL_WIN_PCT = merged_data['win_pct'].to_numpy(dtype=float)
+SCHOOL_ACCEPT_RATE = merged_data['accept_rate_pct'].to_numpy(dtype=float)
+SCHOOL_SAT = merged_data['sat_score'].to_numpy(dtype=float)
+# Null checks used by the US News and religious affiliation filters
+SCHOOL_US_RANKED = merged_data['US_Rank'].notna().to_numpy()
+SCHOOL_RELAFFIL_MISSING = merged_data['relaffil'].isna().to_numpy()
+
+# Monthly climate as per-month arrays: month -> (unitid, t2m, prectotcorr, cloud_amt)
+CLIMATE_BY_MONTH = {
+    month: (group['unitid'].to_numpy(), group['t2m'].to_numpy(dtype=float),
+            group['prectotcorr'].to_numpy(dtype=float), group['cloud_amt'].to_numpy(dtype=float))
+    for month, group in climate_monthly.groupby('month')
+}
+
+# Positional row indexes for the categorical filters, so filter_data can skip full-frame isin scans
+DIVISION_ROWS = merged_data.groupby('division', observed=True).indices
+CONFERENCE_ROWS = merged_data.groupby('Conference_Name', observed=True).indices
+REGION_ROWS = merged_data.groupby('region', observed=True).indices
+# Rows of each school by unitid (a few unitids appear on more than one row)
+UNITID_ROWS = merged_data.groupby('unitid').indices
+
+def lookup_rows(row_index, values):
+    """Sorted positional rows of merged_data matching any of the selected values"""
+    matches = [row_index[v] for v in values if v in row_index]
+    return np.sort(np.concatenate(matches)) if matches else np.array([], dtype=np.intp)
+
+def get_school_row(unitid):
+    """First merged_data row for a unitid (KeyError if unknown)"""
+    return merged_data.iloc[UNITID_ROWS[unitid][0]]
+
+def get_school_rows(unitids):
+    """All merged_data rows for the given unitids, in merged_data order"""
+    return merged_data.iloc[lookup_rows(UNITID_ROWS, dict.fromkeys(unitids))]
+
+def category_mask(series, values):
+    """Boolean array of which rows of a categorical column take one of the values (missing never matches)"""
+    categories = series.cat.categories
+    # One slot per category plus a trailing False slot that missing values (code -1) land in
+    lookup = np.zeros(len(categories) + 1, dtype=bool)
+    codes = categories.get_indexer(pd.Index(values).drop_duplicates())
+    lookup[codes[codes >= 0]] = True
+    return lookup[series.cat.codes.to_numpy()]
+
 # ============================================================================
 # ROSTER METRICS HELPER FUNCTIONS
 # ============================================================================
@@ -82,54 +211,51 @@ def calculate_team_trajectory(school_data, merged_data_full):
     """Get 10-year win% history for plotting"""
     try:
         # Use prev_team_id to match with team_history
-        prev_team_id = school_data['prev_team_id'] if 'prev_team_id' in school_data else school_data.get('prev_team_id')
+        prev_team_id = school_data.get('prev_team_id')
         
         if pd.isna(prev_team_id):
             print(f"No prev_team_id for school")
             return None
         
         # Convert to numeric for matching
-        prev_team_id = int(float(prev_team_id))
-        
+        return get_team_trajectory(int(float(prev_team_id)))
+    except Exception as e:
+        print(f"Error calculating team trajectory: {e}")
+        return None
+
+@lru_cache(maxsize=4096)
+def get_team_trajectory(prev_team_id):
+    """Trajectory for one prev_team_id, cached since team_history never changes at runtime"""
+    try:
         print(f"Looking for trajectory data for prev_team_id: {prev_team_id}")
         
         # Get historical data for this school using prev_team_id
-        school_history = team_history[team_history['prev_team_id'] == prev_team_id].copy()
+        school_history = TEAM_HISTORY_BY_TID.get(prev_team_id)
         
-        if school_history.empty:
+        if school_history is None:
             print(f"No historical data found for prev_team_id: {prev_team_id}")
             return None
         
-        print(f"Found {len(school_history)} years of data")
-        
-        # Convert Year from "2025-26" format to numeric (use ending year: 2026)
-        # This way "2024-25" becomes 2025, representing when the season ends
-        # Works for any century: "1898-99" -> 1899, "1999-00" -> 2000, "2024-25" -> 2025
-        school_history['Year'] = school_history['Year'].astype(str).str.split('-').str[0].astype(int) + 1
-        
-        # Convert WL_pct from ".596" to 0.596
-        school_history['WL_pct'] = pd.to_numeric(school_history['WL_pct'].astype(str).str.replace('.', '', regex=False), errors='coerce') / 1000
-        
-        # Filter out only invalid data (NaN), but keep 0 wins (winless seasons)
-        school_history = school_history[school_history['WL_pct'].notna()]
+        season_years, season_win_pcts = school_history
+        print(f"Found {len(season_years)} years of data")
         
         # Get last 10 years of complete data (up to most recent complete season)
+        # Seasons are sorted by year at load, so binary search for the window
         current_year = 2025  # Current date is Dec 2025, so 2024-25 season (labeled 2025) just ended
-        school_history = school_history[
-            (school_history['Year'] >= current_year - 9) & 
-            (school_history['Year'] <= current_year)
-        ].sort_values('Year')
+        start = np.searchsorted(season_years, current_year - 9)
+        end = np.searchsorted(season_years, current_year, side='right')
         
-        if len(school_history) < 2:
+        if end - start < 2:
             return None
         
         # Calculate trend
-        years = school_history['Year'].values
-        win_pcts = school_history['WL_pct'].values
+        years = season_years[start:end]
+        win_pcts = season_win_pcts[start:end]
         
-        # Simple linear regression
+        # Simple linear regression (closed-form least-squares slope)
         if len(years) > 1:
-            slope = np.polyfit(years, win_pcts, 1)[0]
+            year_offsets = years - years.mean()
+            slope = (year_offsets * (win_pcts - win_pcts.mean())).sum() / (year_offsets ** 2).sum()
             if slope > 0.01:
                 trend = 'improving'
                 indicator = '↑'
@@ -159,10 +285,39 @@ def calculate_team_trajectory(school_data, merged_data_full):
         print(f"Error calculating team trajectory: {e}")
         return None
 
+def top_states_with_other(state_counts, top_n=8):
+    """Split sorted state counts into top-N labels/values lists plus an "Other" bucket for the rest"""
+    labels = state_counts.index[:top_n].tolist()
+    values = state_counts.values[:top_n].tolist()
+    if len(state_counts) > top_n:
+        labels.append('Other')
+        values.append(int(state_counts.values[top_n:].sum()))
+    return labels, values
+
+# Layout shared by both state distribution pies
+STATE_PIE_LAYOUT = dict(
+    height=300,
+    margin=dict(l=20, r=20, t=30, b=20),
+    showlegend=True,
+    legend=dict(orientation="v", yanchor="middle", y=0.5, xanchor="left", x=1.05)
+)
+
+def create_state_pie(labels, values):
+    """Donut chart of player counts by home state"""
+    fig = go.Figure(data=[go.Pie(
+        labels=labels,
+        values=values,
+        hole=0.3,
+        textinfo='label+percent',
+        hovertemplate='%{label}: %{value} players<extra></extra>'
+    )])
+    fig.update_layout(**STATE_PIE_LAYOUT)
+    return fig
+
 def get_state_distribution_charts(school_data):
     """Create pie charts showing geographic distribution of players"""
     try:
-        prev_team_id = school_data['prev_team_id'] if 'prev_team_id' in school_data else school_data.get('prev_team_id')
+        prev_team_id = school_data.get('prev_team_id')
         
         if pd.isna(prev_team_id):
             return None, None
@@ -170,60 +325,32 @@ def get_state_distribution_charts(school_data):
         prev_team_id = int(float(prev_team_id))
         
         # Get roster data for this team
-        team_rosters = roster_data[roster_data['prev_team_id'] == prev_team_id].copy()
+        team_rosters = ROSTER_BY_TID.get(prev_team_id)
         
-        if team_rosters.empty:
+        if team_rosters is None:
             return None, None
         
+        # One pass over the team: 2022-2025 players with a recorded home state
+        # (missing and blank states are skipped; the 2025 chart is a subset of these rows)
+        years = team_rosters['year']
+        in_multi = years.between(2022, 2025)
+        multi_rows = team_rosters.loc[in_multi & (team_rosters['State'].str.len() > 0), ['year', 'State']]
+        
         # Most recent season (2025)
-        recent_roster = team_rosters[team_rosters['year'] == 2025]
-        if not recent_roster.empty:
-            recent_states = recent_roster[recent_roster['State'].notna() & (recent_roster['State'] != '')]['State'].value_counts()
-            # Keep top 8 states, group rest as "Other"
-            if len(recent_states) > 8:
-                top_states = recent_states.head(8)
-                other_count = recent_states[8:].sum()
-                recent_states = pd.concat([top_states, pd.Series({'Other': other_count})])
+        if (years == 2025).any():
+            recent_states = multi_rows.loc[multi_rows['year'] == 2025, 'State'].value_counts()
+            recent_labels, recent_values = top_states_with_other(recent_states)
             
-            fig_recent = go.Figure(data=[go.Pie(
-                labels=recent_states.index,
-                values=recent_states.values,
-                hole=0.3,
-                textinfo='label+percent',
-                hovertemplate='%{label}: %{value} players<extra></extra>'
-            )])
-            fig_recent.update_layout(
-                height=300,
-                margin=dict(l=20, r=20, t=30, b=20),
-                showlegend=True,
-                legend=dict(orientation="v", yanchor="middle", y=0.5, xanchor="left", x=1.05)
-            )
+            fig_recent = create_state_pie(recent_labels, recent_values)
         else:
             fig_recent = None
         
         # 2022-2025 aggregated
-        multi_year = team_rosters[team_rosters['year'].between(2022, 2025)]
-        if not multi_year.empty:
-            multi_states = multi_year[multi_year['State'].notna() & (multi_year['State'] != '')]['State'].value_counts()
-            # Keep top 8 states, group rest as "Other"
-            if len(multi_states) > 8:
-                top_states = multi_states.head(8)
-                other_count = multi_states[8:].sum()
-                multi_states = pd.concat([top_states, pd.Series({'Other': other_count})])
+        if in_multi.any():
+            multi_states = multi_rows['State'].value_counts()
+            multi_labels, multi_values = top_states_with_other(multi_states)
             
-            fig_multi = go.Figure(data=[go.Pie(
-                labels=multi_states.index,
-                values=multi_states.values,
-                hole=0.3,
-                textinfo='label+percent',
-                hovertemplate='%{label}: %{value} players<extra></extra>'
-            )])
-            fig_multi.update_layout(
-                height=300,
-                margin=dict(l=20, r=20, t=30, b=20),
-                showlegend=True,
-                legend=dict(orientation="v", yanchor="middle", y=0.5, xanchor="left", x=1.05)
-            )
+            fig_multi = create_state_pie(multi_labels, multi_values)
         else:
             fig_multi = None
         
@@ -243,46 +370,40 @@ def calculate_freshman_retention(school_data):
         return None
     
     try:
-        prev_team_id_int = int(float(prev_team_id))
-        
+        return get_freshman_retention(int(float(prev_team_id)))
+    except Exception as e:
+        print(f"Error calculating freshman retention: {e}")
+        return None
+
+@lru_cache(maxsize=4096)
+def get_freshman_retention(prev_team_id):
+    """Freshman retention for one prev_team_id, cached since roster_data never changes at runtime"""
+    try:
         # Get all roster data for this team
-        team_roster = roster_data[roster_data['prev_team_id'] == prev_team_id_int].copy()
+        team_roster = ROSTER_BY_TID.get(prev_team_id)
         
-        if team_roster.empty:
+        if team_roster is None:
             return None
         
-        # Get unique years and sort
-        unique_years = sorted(team_roster['year'].unique())
-        
-        retention_rates = []
+        # Pair each roster year with the next year on record
+        unique_years = np.sort(team_roster['year'].unique())
+        next_year = dict(zip(unique_years[:-1], unique_years[1:]))
         
-        # Loop through consecutive year pairs
-        for i in range(len(unique_years) - 1):
-            current_yr = unique_years[i]
-            next_yr = unique_years[i + 1]
-            
-            # Find freshmen in current year
-            freshmen = team_roster[
-                (team_roster['year'] == current_yr) & 
-                (team_roster['class'].str.strip() == 'Fr.')
-            ]['player_name'].unique()
-            
-            if len(freshmen) > 0:
-                # Check how many returned in next year
-                returning = team_roster[
-                    (team_roster['year'] == next_yr) & 
-                    (team_roster['player_name'].isin(freshmen))
-                ]['player_name'].unique()
-                
-                rate = len(returning) / len(freshmen)
-                retention_rates.append(rate)
+        # Freshmen in every year that has a following year
+        freshmen = team_roster.loc[team_roster['class'] == 'Fr.', ['year', 'player_name']].drop_duplicates()
+        freshmen = freshmen[freshmen['year'].isin(unique_years[:-1])]
         
-        # Calculate average retention rate
-        if retention_rates:
-            avg_retention = sum(retention_rates) / len(retention_rates) * 100
-            return round(avg_retention, 1)
-        else:
+        if freshmen.empty:
             return None
+        
+        # Check in one pass which freshmen appear on the following year's roster
+        on_roster = pd.MultiIndex.from_frame(team_roster[['year', 'player_name']])
+        returned = pd.MultiIndex.from_arrays([freshmen['year'].map(next_year), freshmen['player_name']]).isin(on_roster)
+        
+        # Average the per-year retention rates
+        retention_rates = pd.Series(returned, index=freshmen['year'].to_numpy()).groupby(level=0).mean()
+        avg_retention = sum(retention_rates) / len(retention_rates) * 100
+        return round(avg_retention, 1)
             
     except Exception as e:
         print(f"Error calculating freshman retention: {e}")
@@ -293,8 +414,8 @@ def calculate_freshman_retention(school_data):
 def calculate_instate_recruiting(school_data, roster_data_full):
     """Calculate percentage of roster from home state"""
     try:
-        unitid = school_data['unitid'] if 'unitid' in school_data else school_data.get('unitid')
-        home_state = school_data['state_abbr'] if 'state_abbr' in school_data else school_data.get('state_abbr', '')
+        unitid = school_data.get('unitid')
+        home_state = school_data.get('state_abbr', '')
         
         if unitid not in roster_data_full['unitid'].values or not home_state:
             return 0
@@ -342,13 +463,18 @@ def get_playing_time_by_class(school_data):
     except:
         return {'Fr': 0, 'So': 0, 'Jr': 0, 'Sr': 0}
 
+# Pre-formatted feet'inches" labels for every whole inch up to 8 feet
+HEIGHT_LABELS = [f"{i // 12}'{i % 12}\"" for i in range(97)]
+
 def inches_to_feet_inches(inches):
     """Convert decimal inches to feet'inches" format"""
     if pd.isna(inches) or not inches or inches == 0:
         return "N/A"
-    feet = int(inches // 12)
-    remaining_inches = int(round(inches % 12))
-    return f"{feet}'{remaining_inches}\""
+    # Round the total first so e.g. 71.6 becomes 6'0" rather than 5'12"
+    whole_inches = int(round(inches))
+    if whole_inches < len(HEIGHT_LABELS):
+        return HEIGHT_LABELS[whole_inches]
+    return f"{whole_inches // 12}'{whole_inches % 12}\""
 
 def get_position_depth(school_data):
     """Get roster count by position group from actual roster data"""
@@ -358,49 +484,24 @@ def get_position_depth(school_data):
         if pd.isna(prev_team_id):
             return {'P': 0, 'C': 0, 'IF': 0, 'OF': 0}
         
-        prev_team_id_int = int(float(prev_team_id))
-        
-        # Get most recent year's roster (2025)
-        team_roster = roster_data_full[
-            (roster_data_full['prev_team_id'] == prev_team_id_int) & 
-            (roster_data_full['year'] == 2025)
-        ]
-        
-        if team_roster.empty:
-            return {'P': 0, 'C': 0, 'IF': 0, 'OF': 0}
-        
-        # Count by position groups
-        pitchers = 0
-        catchers = 0
-        infielders = 0
-        outfielders = 0
-        
-        for _, player in team_roster.iterrows():
-            pos = str(player.get('position', '')).strip().upper()
-            
-            # Pitchers: P, RHP, LHP, etc.
-            if 'P' in pos and pos != 'DH':
-                pitchers += 1
-            # Catchers
-            elif pos == 'C':
-                catchers += 1
-            # Infielders: 1B, 2B, 3B, SS, IF, INF
-            elif any(x in pos for x in ['1B', '2B', '3B', 'SS', 'IF', 'INF']) and 'OF' not in pos:
-                infielders += 1
-            # Outfielders: OF, LF, CF, RF
-            elif 'OF' in pos or any(x in pos for x in ['LF', 'CF', 'RF']):
-                outfielders += 1
-        
-        return {
-            'P': pitchers,
-            'C': catchers,
-            'IF': infielders,
-            'OF': outfielders
-        }
+        return dict(get_position_counts(int(float(prev_team_id))))
     except Exception as e:
         print(f"Error calculating position depth: {e}")
         return {'P': 0, 'C': 0, 'IF': 0, 'OF': 0}
 
+@lru_cache(maxsize=4096)
+def get_position_counts(prev_team_id):
+    """2025 position group counts for one prev_team_id as (group, count) pairs, cached per team"""
+    # Get most recent year's roster (2025)
+    team_roster = get_roster_2025_by_team().get(prev_team_id)
+    
+    if team_roster is None:
+        return tuple((group, 0) for group in POSITION_GROUPS)
+    
+    # Position groups are classified once at load
+    counts = team_roster['position_group'].value_counts()
+    return tuple((group, int(counts[group])) for group in POSITION_GROUPS)
+
 def calculate_trajectory_display(school_data):
     """Create display for team trajectory metric with line chart"""
     trajectory = calculate_team_trajectory(school_data, merged_data)
@@ -475,6 +576,11 @@ def calculate_instate_display(school_data):
         ], style={'marginTop': '5px', 'display': 'block'})
     ])
 
+# Shared styles for the per-class rows in the class distribution display
+CLASS_LABEL_STYLE = {'fontWeight': 'bold'}
+CLASS_COUNT_STYLE = {'marginRight': '5px'}
+CLASS_ROW_STYLE = {'marginBottom': '5px'}
+
 def calculate_class_distribution_display(school_data):
     """Create display for playing time by class"""
     class_data = get_playing_time_by_class(school_data)
@@ -483,25 +589,11 @@ def calculate_class_distribution_display(school_data):
     return html.Div([
         html.Div([
             html.Div([
-                html.Span("Fr: ", style={'fontWeight': 'bold'}),
-                html.Span(f"{class_data['Fr']} ", style={'marginRight': '5px'}),
-                html.Small(f"({class_data['Fr']/total*100:.0f}%)" if total > 0 else "(0%)", className='text-muted')
-            ], style={'marginBottom': '5px'}),
-            html.Div([
-                html.Span("So: ", style={'fontWeight': 'bold'}),
-                html.Span(f"{class_data['So']} ", style={'marginRight': '5px'}),
-                html.Small(f"({class_data['So']/total*100:.0f}%)" if total > 0 else "(0%)", className='text-muted')
-            ], style={'marginBottom': '5px'}),
-            html.Div([
-                html.Span("Jr: ", style={'fontWeight': 'bold'}),
-                html.Span(f"{class_data['Jr']} ", style={'marginRight': '5px'}),
-                html.Small(f"({class_data['Jr']/total*100:.0f}%)" if total > 0 else "(0%)", className='text-muted')
-            ], style={'marginBottom': '5px'}),
-            html.Div([
-                html.Span("Sr: ", style={'fontWeight': 'bold'}),
-                html.Span(f"{class_data['Sr']} ", style={'marginRight': '5px'}),
-                html.Small(f"({class_data['Sr']/total*100:.0f}%)" if total > 0 else "(0%)", className='text-muted')
-            ])
+                html.Span(f"{cls}: ", style=CLASS_LABEL_STYLE),
+                html.Span(f"{class_data[cls]} ", style=CLASS_COUNT_STYLE),
+                html.Small(f"({class_data[cls]/total*100:.0f}%)" if total > 0 else "(0%)", className='text-muted')
+            ], style=CLASS_ROW_STYLE if cls != 'Sr' else None)
+            for cls in ('Fr', 'So', 'Jr', 'Sr')
         ]),
         html.Hr(style={'margin': '10px 0'}),
         html.Small(f"Total Players: {total}", className='text-muted')
@@ -576,30 +668,45 @@ except Exception as e:
     ncaa_name_to_slug = {}
     ncaa_long_to_slug = {}
 
+# Lowercased names for the partial-match fallback, computed once instead of per lookup
+ncaa_lower_names = [(name.lower(), slug) for name, slug in ncaa_name_to_slug.items()]
+
 # ============================================================================
 # COLLEGE SCORECARD API FUNCTIONS
 # ============================================================================
 
+# Scorecard results by UNITID - school data doesn't change while the app is running
+scorecard_cache = {}
+# Reuse pooled connections across Scorecard requests
+scorecard_session = requests.Session()
+SCORECARD_BATCH_SIZE = 100
+
 def fetch_college_scorecard_data(unitid):
     """
     Fetch college data from College Scorecard API using UNITID
     Returns a dictionary with additional metrics
     """
     try:
+        if int(unitid) in scorecard_cache:
+            return scorecard_cache[int(unitid)]
+        
         params = {
             'api_key': COLLEGE_SCORECARD_API_KEY,
             'id': int(unitid)
         }
         
-        response = requests.get(COLLEGE_SCORECARD_API_URL, params=params, timeout=10)
+        response = scorecard_session.get(COLLEGE_SCORECARD_API_URL, params=params, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
             if data.get('results') and len(data['results']) > 0:
                 result = data['results'][0]
+                scorecard_cache[int(unitid)] = result
                 print(f"Successfully fetched data for: {result.get('school', {}).get('name', 'Unknown')}")
                 return result
             else:
+                # Remember the miss too, so the school isn't re-requested on every render
+                scorecard_cache[int(unitid)] = None
                 print(f"No results found for unitid {unitid}")
         else:
             print(f"API Error {response.status_code}: {response.text[:200]}")
@@ -610,6 +717,81 @@ def fetch_college_scorecard_data(unitid):
         print(f"Error fetching College Scorecard data for unitid {unitid}: {e}")
         return None
 
+def fetch_college_scorecard_batch(unitids):
+    """
+    Fetch College Scorecard data for several UNITIDs, up to 100 per request
+    Returns a dictionary of unitid -> result (None when unavailable)
+    """
+    missing = [int(u) for u in unitids if int(u) not in scorecard_cache]
+    for start in range(0, len(missing), SCORECARD_BATCH_SIZE):
+        batch = missing[start:start + SCORECARD_BATCH_SIZE]
+        try:
+            params = {
+                'api_key': COLLEGE_SCORECARD_API_KEY,
+                'id': ','.join(str(u) for u in batch),
+                'per_page': SCORECARD_BATCH_SIZE
+            }
+            
+            response = scorecard_session.get(COLLEGE_SCORECARD_API_URL, params=params, timeout=10)
+            
+            if response.status_code == 200:
+                # Schools the API has no record for are cached as None, like single lookups
+                scorecard_cache.update(dict.fromkeys(batch))
+                for result in response.json().get('results', []):
+                    scorecard_cache[result.get('id')] = result
+                print(f"Fetched College Scorecard data for {len(batch)} schools")
+            else:
+                print(f"API Error {response.status_code}: {response.text[:200]}")
+        except Exception as e:
+            print(f"Error fetching College Scorecard batch: {e}")
+    
+    return {u: scorecard_cache.get(int(u)) for u in unitids}
+
+# College Scorecard style badges: icon file and label, looked up per school
+SCORECARD_ICON_URL = "https://collegescorecard.ed.gov/school-icons/"
+CONTROL_BADGES = {1: ("public.svg", "Public"), 2: ("private.svg", "Private Nonprofit")}
+CONTROL_BADGE_DEFAULT = ("private.svg", "Private For-Profit")
+LOCALE_BADGES = [(11, 13, "city.svg", "City"), (21, 23, "suburban.svg", "Suburb"), (31, 33, "town.svg", "Town")]
+LOCALE_BADGE_DEFAULT = ("rural.svg", "Rural")
+SIZE_BADGES = [(2000, "small.svg", "Small"), (15000, "medium.svg", "Medium")]
+SIZE_BADGE_DEFAULT = ("large.svg", "Large")
+
+def make_scorecard_badge(icon, label):
+    """One College Scorecard style badge (icon over a label)"""
+    return html.Div([
+        html.Div([html.Img(src=SCORECARD_ICON_URL + icon)], className='icon'),
+        html.Div(label, className='scorecard-label')
+    ], className='scorecard-badge')
+
+def get_scorecard_badges(school):
+    """Year, control, locale and size badges for a school"""
+    locale = school.get('locale', 0)
+    ugds = school.get('ugds', 0)
+    locale_badge = next(((icon, label) for low, high, icon, label in LOCALE_BADGES if low <= locale <= high),
+                        LOCALE_BADGE_DEFAULT)
+    size_badge = next(((icon, label) for limit, icon, label in SIZE_BADGES if ugds < limit), SIZE_BADGE_DEFAULT)
+    return [
+        make_scorecard_badge("four.svg", "Year"),
+        make_scorecard_badge(*CONTROL_BADGES.get(school.get('control'), CONTROL_BADGE_DEFAULT)),
+        make_scorecard_badge(*locale_badge),
+        make_scorecard_badge(*size_badge)
+    ]
+
+def make_metric_card(title, value, heading=html.H3, width=3):
+    """Centered stat card (muted title over a value) in a grid column"""
+    return dbc.Col([
+        dbc.Card([
+            dbc.CardBody([
+                html.H6(title, className="text-muted mb-2"),
+                heading(value, className="mb-0")
+            ])
+        ], className="text-center")
+    ], width=width)
+
+def safe_int(value, default=0):
+    """int of a numeric value, or the default when it is missing (None/NaN)"""
+    return default if value is None or value != value else int(value)
+
 def format_currency(value):
     """Format value as currency"""
     if value is None or pd.isna(value):
@@ -622,8 +804,9 @@ def format_percentage(value):
         return 'N/A'
     return f"{value * 100:.1f}%"
 
+@lru_cache(maxsize=4096)
 def get_school_logo_url(school_name, ncaa_name=None):
-    """Generate NCAA API logo URL from school name using the schools index"""
+    """Generate NCAA API logo URL from school name using the schools index (cached per name)"""
     # First try to match with NCAA_name.x field if provided
     if ncaa_name and ncaa_name in ncaa_name_to_slug:
         slug = ncaa_name_to_slug[ncaa_name]
@@ -636,8 +819,8 @@ def get_school_logo_url(school_name, ncaa_name=None):
     
     # Fallback: try to find partial match
     school_lower = school_name.lower()
-    for ncaa_name, slug in ncaa_name_to_slug.items():
-        if ncaa_name.lower() in school_lower or school_lower in ncaa_name.lower():
+    for ncaa_lower, slug in ncaa_lower_names:
+        if ncaa_lower in school_lower or school_lower in ncaa_lower:
             return f"https://ncaa-api.henrygd.me/logo/{slug}.svg"
     
     # Last resort: create a slug from the school name
@@ -655,18 +838,43 @@ def get_school_logo_url(school_name, ncaa_name=None):
 # HELPER FUNCTIONS
 # ============================================================================
 
-def calculate_distance(home_lat, home_lon, school_lat, school_lon):
-    """Calculate distance in miles between two coordinates"""
-    return geodesic((home_lat, home_lon), (school_lat, school_lon)).miles
+EARTH_RADIUS_MILES = 3958.7613
+
+def calculate_distance(home_lat, home_lon, rows=None):
+    """Haversine distance in miles from home to each school (or only the given positional rows)"""
+    home_lat, home_lon = np.radians(home_lat), np.radians(home_lon)
+    school_lat, school_lon, school_cos_lat = SCHOOL_LAT_RAD, SCHOOL_LON_RAD, SCHOOL_COS_LAT
+    if rows is not None:
+        school_lat, school_lon, school_cos_lat = school_lat[rows], school_lon[rows], school_cos_lat[rows]
+    a = (np.sin((school_lat - home_lat) / 2) ** 2 +
+         np.cos(home_lat) * school_cos_lat * np.sin((school_lon - home_lon) / 2) ** 2)
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(a))
+
+@lru_cache(maxsize=1)
+def get_geolocator():
+    """Shared Nominatim client, created on first geocode"""
+    from geopy.geocoders import Nominatim
+    return Nominatim(user_agent="ncaa_baseball_finder")
+
+@lru_cache(maxsize=10000)
+def lookup_zip_coordinates(zipcode):
+    """(lat, lon) for a zip code, or None if not found - cached so each zip hits Nominatim once"""
+    location = get_geolocator().geocode(f"{zipcode}, USA")
+    if location:
+        return location.latitude, location.longitude
+    return None
 
 def geocode_zip(zipcode):
     """Geocode a US zip code to latitude/longitude"""
+    # Only well-formed zips (ZIP+4 uses its first five digits) go to the geocoder,
+    # so partial input never costs a network call
+    zip5 = str(zipcode).strip().split('-')[0]
+    if len(zip5) != 5 or not zip5.isdigit():
+        return None
     try:
-        from geopy.geocoders import Nominatim
-        geolocator = Nominatim(user_agent="ncaa_baseball_finder")
-        location = geolocator.geocode(f"{zipcode}, USA")
-        if location:
-            return {'lat': location.latitude, 'lon': location.longitude}
+        coords = lookup_zip_coordinates(zip5)
+        if coords:
+            return {'lat': coords[0], 'lon': coords[1]}
     except Exception as e:
         print(f"Error geocoding zip {zipcode}: {e}")
     return None
@@ -675,6 +883,15 @@ def geocode_zip(zipcode):
 # UI CONSTANTS
 # ============================================================================
 
+# Text inputs only send their value once typing pauses for this long
+INPUT_DEBOUNCE_MS = 300
+
+# Slider tick labels, shared by the sliders that use the same scale
+MARKS_0_2500 = {i: str(i) for i in range(0, 2501, 500)}
+MARKS_0_100 = {i: str(i) for i in range(0, 101, 20)}
+MARKS_0_10 = {i: str(i) for i in range(0, 11, 2)}
+MARKS_800_1600 = {i: str(i) for i in range(800, 1601, 200)}
+
 # Division choices
 DIVISION_OPTIONS = [
     {'label': 'Division 1', 'value': 1},
@@ -801,6 +1018,10 @@ RELIGIOUS_AFFILIATIONS = sorted([v for v in merged_data['relaffil'].dropna().uni
 RELIGIOUS_OPTIONS = [{'label': 'Non-affiliated', 'value': NON_AFFILIATED}] + \
                     [{'label': RELIGIOUS_MAP.get(r, f'Code {int(r)}'), 'value': r} for r in RELIGIOUS_AFFILIATIONS]
 
+# Lowercased labels for the conference/religious search boxes, built once
+CONFERENCE_SEARCH_INDEX = [(opt['label'].lower(), opt) for opt in CONFERENCE_OPTIONS]
+RELIGIOUS_SEARCH_INDEX = [(opt['label'].lower(), opt) for opt in RELIGIOUS_OPTIONS]
+
 # Enrollment size categories
 ENROLLMENT_CATEGORIES = [
     {'label': 'Extra-Small (< 1k)', 'value': 'extra-small', 'range': [0, 999]},
@@ -811,6 +1032,10 @@ ENROLLMENT_CATEGORIES = [
     {'label': 'Extra Large (30k+)', 'value': 'extra-large', 'range': [30000, 999999]}
 ]
 ENROLLMENT_VALUES = [cat['value'] for cat in ENROLLMENT_CATEGORIES]
+ENROLLMENT_OPTIONS = [{'label': cat['label'], 'value': cat['value']} for cat in ENROLLMENT_CATEGORIES]
+# Bucket each school's undergrad enrollment once (missing counts as 0, out-of-range stays NaN)
+ENROLLMENT_BINS = pd.IntervalIndex.from_tuples([tuple(cat['range']) for cat in ENROLLMENT_CATEGORIES], closed='both')
+merged_data['enrollment_category'] = pd.cut(merged_data['ugds'].fillna(0), ENROLLMENT_BINS).cat.rename_categories(ENROLLMENT_VALUES)
 
 # Month choices for climate
 MONTH_OPTIONS = [
@@ -829,6 +1054,57 @@ MONTH_OPTIONS = [
     {'label': 'December', 'value': 12}
 ]
 
+# Map marker colors by division
+DIVISION_COLORS = {
+    1: '#1f77b4',  # Blue for Division 1
+    2: '#0d47a1',  # Dark Blue for Division 2
+    3: '#7b1fa2'   # Purple for Division 3
+}
+# Hover text (just the school name) and marker color only depend on the school - build them once
+merged_data['map_hover_text'] = '<b>' + merged_data['inst_name'] + '</b>'
+merged_data['map_marker_color'] = merged_data['division'].map(DIVISION_COLORS).fillna('#1f77b4')
+
+def get_map_marker_data(df):
+    """Per-school marker arrays for the map trace"""
+    return {
+        'lat': df['latitude'].tolist(),
+        'lon': df['longitude'].tolist(),
+        'text': df['map_hover_text'].tolist(),
+        'marker_color': df['map_marker_color'].tolist(),
+        'customdata': df[['unitid', 'inst_name']].values.tolist()
+    }
+
+def create_map_figure(df):
+    """Build the full school map figure - sent once with the layout, filter changes only patch the trace"""
+    markers = get_map_marker_data(df)
+    fig = go.Figure(go.Scattermap(
+        lat=markers['lat'],
+        lon=markers['lon'],
+        mode='markers',
+        marker=dict(size=8, color=markers['marker_color']),
+        text=markers['text'],
+        hovertemplate='<b>%{text}</b><extra></extra>',
+        customdata=markers['customdata'],
+        name='Schools',
+        hoverinfo='skip'
+    ))
+    
+    # Enable event+select click mode to ensure click events fire reliably
+    fig.update_layout(
+        clickmode='event+select',
+        map=dict(
+            style='open-street-map',
+            center=dict(lat=39.8283, lon=-98.5795),
+            zoom=3.5
+        ),
+        margin=dict(l=0, r=0, t=0, b=0),
+        height=800,
+        hoverlabel=dict(namelength=-1),
+        # Keep the user's pan/zoom if the whole figure is ever re-sent
+        uirevision='schools'
+    )
+    return fig
+
 # ============================================================================
 # LAYOUT
 # ============================================================================
@@ -851,7 +1127,7 @@ sidebar = dbc.Col([
         # Location Panel
         dbc.AccordionItem([
             dbc.Label('Home Zip Code'),
-            dbc.Input(id='home-zip', type='text', value='21703', placeholder='e.g., 90210'),
+            dbc.Input(id='home-zip', type='text', value='21703', placeholder='e.g., 90210', debounce=INPUT_DEBOUNCE_MS),
             
             html.Div(className='mb-3'),
             
@@ -862,7 +1138,7 @@ sidebar = dbc.Col([
                 max=2500,
                 step=50,
                 value=2500,
-                marks={i: str(i) for i in range(0, 2501, 500)},
+                marks=MARKS_0_2500,
                 tooltip={'placement': 'bottom', 'always_visible': True}
             ),
             
@@ -901,7 +1177,7 @@ sidebar = dbc.Col([
                 max=100,
                 step=1, 
                 value=[0, 100],
-                marks={i: str(i) for i in range(0, 101, 20)},
+                marks=MARKS_0_100,
                 tooltip={'placement': 'bottom', 'always_visible': True}
             ),
             
@@ -914,7 +1190,7 @@ sidebar = dbc.Col([
                 max=10,
                 step=0.1,
                 value=[0, 10],
-                marks={i: str(i) for i in range(0, 11, 2)},
+                marks=MARKS_0_10,
                 tooltip={'placement': 'bottom', 'always_visible': True}
             ),
             
@@ -927,7 +1203,7 @@ sidebar = dbc.Col([
                 max=100,
                 step=1,
                 value=[0, 100],
-                marks={i: str(i) for i in range(0, 101, 20)},
+                marks=MARKS_0_100,
                 tooltip={'placement': 'bottom', 'always_visible': True}
             ),
             
@@ -952,7 +1228,7 @@ sidebar = dbc.Col([
                 max=100,
                 step=1,
                 value=[0, 100],
-                marks={i: str(i) for i in range(0, 101, 20)},
+                marks=MARKS_0_100,
                 tooltip={'placement': 'bottom', 'always_visible': True}
             ),
             
@@ -963,7 +1239,8 @@ sidebar = dbc.Col([
                 id='conference-search',
                 type='text',
                 placeholder='Search conferences...',
-                className='mb-2'
+                className='mb-2',
+                debounce=INPUT_DEBOUNCE_MS
             ),
             dbc.Row([
                 dbc.Col([
@@ -1023,7 +1300,7 @@ sidebar = dbc.Col([
                 html.Div([
                     dcc.Checklist(
                         id='enrollment-filter',
-                        options=[{'label': cat['label'], 'value': cat['value']} for cat in ENROLLMENT_CATEGORIES],
+                        options=ENROLLMENT_OPTIONS,
                         value=ENROLLMENT_VALUES,
                         labelStyle={'display': 'block', 'marginBottom': '8px'},
                         inputStyle={'marginRight': '8px'}
@@ -1041,7 +1318,8 @@ sidebar = dbc.Col([
                         id='religious-search',
                         type='text',
                         placeholder='Search affiliations...',
-                        className='mb-2 mt-2'
+                        className='mb-2 mt-2',
+                        debounce=INPUT_DEBOUNCE_MS
                     ),
                     dbc.Row([
                         dbc.Col([
@@ -1081,7 +1359,7 @@ sidebar = dbc.Col([
                 max=100,
                 step=1,
                 value=[0, 100],
-                marks={i: str(i) for i in range(0, 101, 20)},
+                marks=MARKS_0_100,
                 tooltip={'placement': 'bottom', 'always_visible': True}
             ),
             
@@ -1094,7 +1372,7 @@ sidebar = dbc.Col([
                 max=1600,
                 step=10,
                 value=[800, 1600],
-                marks={i: str(i) for i in range(800, 1601, 200)},
+                marks=MARKS_800_1600,
                 tooltip={'placement': 'bottom', 'always_visible': True}
             ),
             
@@ -1111,6 +1389,7 @@ main_tabs = dbc.Tabs([
         html.Div([
             dcc.Graph(
                 id='baseball-map',
+                figure=create_map_figure(merged_data),
                 className='responsive-map',
                 style={'height': '100%'},
                 config={'doubleClick': False, 'responsive': True}
@@ -1126,11 +1405,35 @@ main_tabs = dbc.Tabs([
                 dbc.Button('Add Selected Rows to Saved List', id='add-to-saved', color='primary', className='mb-2')
             ], width=4),
             dbc.Col([
-                dbc.Input(id='school-search', type='text', placeholder='Search schools by name...', className='mb-2')
+                dbc.Input(id='school-search', type='text', placeholder='Search schools by name...', className='mb-2',
+                          debounce=INPUT_DEBOUNCE_MS)
             ], width=8)
         ]),
         html.Hr(),
-        html.Div(id='filtered-table')
+        html.Div(dash_table.DataTable(
+            id='filtered-datatable',
+            columns=[
+                {'name': 'School', 'id': 'inst_name'},
+                {'name': 'Div', 'id': 'division'},
+                {'name': 'Conference', 'id': 'Conference_Name'},
+                {'name': 'W', 'id': 'wins'},
+                {'name': 'L', 'id': 'losses'},
+                {'name': 'Win%', 'id': 'win_pct'},
+                {'name': 'Accept%', 'id': 'accept_rate_pct'},
+                {'name': 'Enrollment', 'id': 'ugds'}
+            ],
+            data=[],
+            row_selectable='multi',
+            selected_rows=[],
+            sort_action='native',
+            style_table={'overflowX': 'auto', 'overflowY': 'auto', 'maxHeight': '600px'},
+            style_cell={'textAlign': 'left', 'padding': '5px'},
+            style_header={'backgroundColor': 'rgb(230, 230, 230)', 'fontWeight': 'bold'},
+            style_data_conditional=[{
+                'if': {'row_index': 'odd'},
+                'backgroundColor': 'rgb(248, 248, 248)'
+            }]
+        ), id='filtered-table')
     ], label='Filtered School List', tab_id='tab-filtered'),
     
     # Saved List Tab
@@ -1166,10 +1469,11 @@ app.layout = dbc.Container([
     dcc.Store(id='saved-schools', data=[]),
     dcc.Store(id='home-location', data=None),
     dcc.Store(id='filter-state', data={}),  # Store for all filter values
+    dcc.Store(id='filtered-rows-store', data=[]),  # All rows matching the filters (before name search)
     dcc.Store(id='filtered-data-store', data=[]),  # Store filtered table data
+    dcc.Store(id='roster-metrics-rendered', data=None),  # Saved list the Metrics tab was last built for
     dcc.Store(id='current-school-unitid', data=None),  # Track current school for team metrics
-    dcc.Store(id='map-click-state', data={'last_unitid': None, 'last_time': 0}),  # Track map clicks for double-click
-    dcc.Store(id='map-selected-unitid', data=None),  # Track currently clicked unitid for add button
+    dcc.Store(id='map-click-state', data={'last_unitid': None, 'last_time': 0, 'selected_unitid': None}),  # Map clicks for double-click and the add button
     
     # Modal for detailed metrics
     dbc.Modal([
@@ -1224,29 +1528,63 @@ def update_home_location(zipcode):
 # Conference search and filter callbacks
 @app.callback(
     Output('conference-filter', 'options'),
-    Input('conference-search', 'value')
+    Input('conference-search', 'value'),
+    prevent_initial_call=True
 )
 def filter_conference_options(search_term):
     """Filter conference options based on search term"""
     if not search_term:
         return CONFERENCE_OPTIONS
     search_lower = search_term.lower()
-    return [opt for opt in CONFERENCE_OPTIONS if search_lower in opt['label'].lower()]
+    return [opt for label, opt in CONFERENCE_SEARCH_INDEX if search_lower in label]
 
 # Religious affiliation search and filter callbacks
 @app.callback(
     Output('religious-filter', 'options'),
-    Input('religious-search', 'value')
+    Input('religious-search', 'value'),
+    prevent_initial_call=True
 )
 def filter_religious_options(search_term):
     """Filter religious affiliation options based on search term"""
     if not search_term:
         return RELIGIOUS_OPTIONS
     search_lower = search_term.lower()
-    return [opt for opt in RELIGIOUS_OPTIONS if search_lower in opt['label'].lower()]
+    return [opt for label, opt in RELIGIOUS_SEARCH_INDEX if search_lower in label]
 
-# Callback to update filter state store when any filter changes
-@app.callback(
+# Collect all filter values into the filter-state store, in the browser. Sliders only
+# report on mouseup, and an unchanged state is not re-written so the map, counter and
+# table callbacks are not re-run for a no-op (e.g. Reset when already at the defaults)
+app.clientside_callback(
+    """
+    function(divisions, conferences, regions, locales, controls,
+             win_pct, accept_rate, sat_range, distance,
+             temp_range, precip_range, cloud_range, clim_month, usnews_ranked,
+             enrollment_range, religious_affils, home_location, current_state) {
+        const state = {
+            divisions: divisions,
+            conferences: conferences,
+            regions: regions,
+            locales: locales,
+            controls: controls,
+            win_pct: win_pct,
+            accept_rate: accept_rate,
+            sat_range: sat_range,
+            distance: distance,
+            temp_range: temp_range,
+            precip_range: precip_range,
+            cloud_range: cloud_range,
+            clim_month: clim_month,
+            usnews_ranked: usnews_ranked,
+            enrollment_range: enrollment_range,
+            religious_affils: religious_affils,
+            home_location: home_location
+        };
+        if (current_state && JSON.stringify(current_state) === JSON.stringify(state)) {
+            return window.dash_clientside.no_update;
+        }
+        return state;
+    }
+    """,
     Output('filter-state', 'data'),
     Input('division-filter', 'value'),
     Input('conference-filter', 'value'),
@@ -1265,35 +1603,8 @@ def filter_religious_options(search_term):
     Input('enrollment-filter', 'value'),
     Input('religious-filter', 'value'),
     Input('home-location', 'data'),
+    State('filter-state', 'data'),
 )
-def update_filter_state(divisions, conferences, regions, locales, controls,
-                       win_pct, accept_rate, sat_range, distance,
-                       temp_range, precip_range, cloud_range, clim_month, usnews_ranked, 
-                       enrollment_range, religious_affils, home_location):
-    """Store all filter values in a single state object"""
-    try:
-        return {
-            'divisions': divisions,
-            'conferences': conferences,
-            'regions': regions,
-            'locales': locales,
-            'controls': controls,
-            'win_pct': win_pct,
-            'accept_rate': accept_rate,
-            'sat_range': sat_range,
-            'distance': distance,
-            'temp_range': temp_range,
-            'precip_range': precip_range,
-            'cloud_range': cloud_range,
-            'clim_month': clim_month,
-            'usnews_ranked': usnews_ranked,
-            'enrollment_range': enrollment_range,
-            'religious_affils': religious_affils,
-            'home_location': home_location
-        }
-    except Exception as e:
-        print(f"Error in update_filter_state: {e}")
-        return {}
 
 # Update school counter from filter state
 @app.callback(
@@ -1324,6 +1635,13 @@ def update_counter(filter_state):
 
 def filter_data_from_state(filter_state):
     """Apply all filters using state dict"""
+    # The counter, map and table callbacks all filter on the same state, so share one result
+    return get_filtered_data(json.dumps(filter_state, sort_keys=True))
+
+@lru_cache(maxsize=16)
+def get_filtered_data(state_key):
+    """Filtered rows for a JSON-encoded filter state - callers must not modify the result"""
+    filter_state = json.loads(state_key)
     return filter_data(
         filter_state.get('divisions', [1, 2, 3]),
         filter_state.get('conferences', CONFERENCES),
@@ -1351,105 +1669,89 @@ def filter_data(divisions, conferences, regions, locales, controls,
     """Apply all filters to the data"""
     try:
         print(f"filter_data called: divisions={divisions}, conferences={type(conferences)}, regions={type(regions)}")
-        df = merged_data.copy()
+        # Narrow to the selected divisions, conferences and regions via the prebuilt row indexes
+        rows = None
+        for values, row_index in ((divisions, DIVISION_ROWS), (conferences, CONFERENCE_ROWS), (regions, REGION_ROWS)):
+            if values:
+                matched = lookup_rows(row_index, values)
+                rows = matched if rows is None else np.intersect1d(rows, matched, assume_unique=True)
+        df = merged_data if rows is None else merged_data.iloc[rows]
+        
+        # Every other filter ANDs into one mask over those rows, so the frame is sliced once at the end
+        mask = np.ones(len(df), dtype=bool)
         
         # Apply distance filter if home location is set
+        distances = None
         if home_location and distance and distance < 2500:
-            df['distance_from_home'] = df.apply(
-                lambda row: calculate_distance(
-                    home_location['lat'], home_location['lon'],
-                    row['latitude'], row['longitude']
-                ) if pd.notna(row['latitude']) and pd.notna(row['longitude']) else 9999,
-                axis=1
-            )
-            df = df[df['distance_from_home'] <= distance]
+            # One vectorized pass over the precomputed coordinates of the rows still in play
+            distances = calculate_distance(home_location['lat'], home_location['lon'], rows)
+            mask &= distances <= distance
         
         # Apply US News ranking filter
         if 'ranked' in usnews_ranked:
-            df = df[df['US_Rank'].notna()]
+            mask &= SCHOOL_US_RANKED if rows is None else SCHOOL_US_RANKED[rows]
         
         # Apply filters
-        if divisions:
-            df = df[df['division'].isin(divisions)]
-        
-        if conferences:
-            df = df[df['Conference_Name'].isin(conferences)]
-        
-        if regions:
-            df = df[df['region'].isin(regions)]
-        
         if locales:
-            df = df[df['locale'].isin(locales)]
+            mask &= category_mask(df['locale'], locales)
         
         if controls:
-            df = df[df['control'].isin(controls)]
+            mask &= category_mask(df['control'], controls)
         
         # Enrollment filter - convert categories to ranges
         if enrollment_range:
             if isinstance(enrollment_range, list) and len(enrollment_range) > 0:
                 # Check if it's categorical values or numeric range
                 if isinstance(enrollment_range[0], str):
-                    # Categorical - convert to range filter
-                    enrollment_masks = []
-                    for cat_value in enrollment_range:
-                        cat = next((c for c in ENROLLMENT_CATEGORIES if c['value'] == cat_value), None)
-                        if cat:
-                            min_val, max_val = cat['range']
-                            enrollment_masks.append((df['ugds'].fillna(0) >= min_val) & (df['ugds'].fillna(0) <= max_val))
-                    if enrollment_masks:
-                        combined_mask = enrollment_masks[0]
-                        for mask in enrollment_masks[1:]:
-                            combined_mask = combined_mask | mask
-                        df = df[combined_mask]
+                    # Categorical - match the precomputed enrollment buckets
+                    selected = [v for v in enrollment_range if v in ENROLLMENT_VALUES]
+                    if selected:
+                        mask &= category_mask(df['enrollment_category'], selected)
                 else:
                     # Legacy numeric range support
-                    df = df[(df['ugds'].fillna(0) >= enrollment_range[0]) & (df['ugds'].fillna(0) <= enrollment_range[1])]
+                    ugds = df['ugds'].fillna(0).to_numpy()
+                    mask &= (ugds >= enrollment_range[0]) & (ugds <= enrollment_range[1])
         
         # Religious affiliation filter
         if religious_affils:
+            religious_match = category_mask(df['relaffil'], religious_affils)
             # Handle non-affiliated schools (those with NaN or -2)
             if NON_AFFILIATED in religious_affils:
-                df = df[(df['relaffil'].isin(religious_affils)) | (df['relaffil'].isna())]
-            else:
-                df = df[df['relaffil'].isin(religious_affils)]
+                religious_match |= SCHOOL_RELAFFIL_MISSING if rows is None else SCHOOL_RELAFFIL_MISSING[rows]
+            mask &= religious_match
         
         # Numeric filters
-        df = df[(df['win_pct'] >= win_pct[0]) & (df['win_pct'] <= win_pct[1])]
-        df = df[(df['accept_rate_pct'] >= accept_rate[0]) & (df['accept_rate_pct'] <= accept_rate[1])]
-        df = df[(df['sat_score'] == 0) | ((df['sat_score'] >= sat_range[0]) & (df['sat_score'] <= sat_range[1]))]
+        win, accept, sat = SCHOOL_WIN_PCT, SCHOOL_ACCEPT_RATE, SCHOOL_SAT
+        if rows is not None:
+            win, accept, sat = win[rows], accept[rows], sat[rows]
+        mask &= (win >= win_pct[0]) & (win <= win_pct[1])
+        mask &= (accept >= accept_rate[0]) & (accept <= accept_rate[1])
+        mask &= (sat == 0) | ((sat >= sat_range[0]) & (sat <= sat_range[1]))
         
         # Climate filtering using long format data
         if clim_month != 'annual':
-            month_data = climate_monthly[climate_monthly['month'] == clim_month].copy()
-            
-            # Apply temperature filter
-            month_data = month_data[
-                (month_data['t2m'].isna()) | 
-                ((month_data['t2m'] >= temp_range[0]) & (month_data['t2m'] <= temp_range[1]))
-            ]
-            
-            # Apply precipitation filter
-            month_data = month_data[
-                (month_data['prectotcorr'].isna()) | 
-                ((month_data['prectotcorr'] >= precip_range[0]) & (month_data['prectotcorr'] <= precip_range[1]))
-            ]
-            
-            # Apply cloud cover filter
-            month_data = month_data[
-                (month_data['cloud_amt'].isna()) | 
-                ((month_data['cloud_amt'] >= cloud_range[0]) & (month_data['cloud_amt'] <= cloud_range[1]))
-            ]
+            if clim_month in CLIMATE_BY_MONTH:
+                month_unitids, t2m, precip, cloud = CLIMATE_BY_MONTH[clim_month]
+                # Missing readings pass; otherwise temperature, precipitation and cloud cover must be in range
+                passes = np.ones(len(month_unitids), dtype=bool)
+                for values, (low, high) in ((t2m, temp_range), (precip, precip_range), (cloud, cloud_range)):
+                    passes &= np.isnan(values) | ((values >= low) & (values <= high))
+                passing_unitids = month_unitids[passes]
+            else:
+                passing_unitids = []
             
             # Filter to schools that pass climate filters
-            passing_unitids = month_data['unitid'].unique()
-            df = df[df['unitid'].isin(passing_unitids)]
+            mask &= df['unitid'].isin(passing_unitids).to_numpy()
         
+        df = df[mask]
+        if distances is not None:
+            df = df.assign(distance_from_home=distances[mask])
         return df
     except Exception as e:
         print(f"Error in filter_data: {e}")
         import traceback
         traceback.print_exc()
-        return merged_data.copy()  # Return all data on error
+        return merged_data  # Return all data on error
 
 # Update map markers
 @app.callback(
@@ -1459,50 +1761,21 @@ def filter_data(divisions, conferences, regions, locales, controls,
 def update_map(filter_state):
     try:
         if not filter_state:
-            filtered = merged_data.copy()
+            filtered = merged_data
         else:
             filtered = filter_data_from_state(filter_state)
         
         print(f"Creating map with {len(filtered)} schools")
         
-        # Define colors by division
-        division_colors = {
-            1: '#1f77b4',  # Blue for Division 1
-            2: '#0d47a1',  # Dark Blue for Division 2
-            3: '#7b1fa2'   # Purple for Division 3
-        }
-        
-        # Create hover text with just school name
-        filtered['hover_text'] = '<b>' + filtered['inst_name'] + '</b>'
-        
-        # Map division to color
-        filtered['marker_color'] = filtered['division'].map(division_colors).fillna('#1f77b4')
-        
-        # Create the map figure
-        fig = go.Figure(go.Scattermap(
-            lat=filtered['latitude'],
-            lon=filtered['longitude'],
-            mode='markers',
-            marker=dict(size=8, color=filtered['marker_color']),
-            text=filtered['hover_text'],
-            hovertemplate='<b>%{text}</b><extra></extra>',
-            customdata=filtered[['unitid', 'inst_name']].values,
-            name='Schools',
-            hoverinfo='skip'
-        ))
-        
-        # Enable event+select click mode to ensure click events fire reliably
-        fig.update_layout(
-            clickmode='event+select',
-            map=dict(
-                style='open-street-map',
-                center=dict(lat=39.8283, lon=-98.5795),
-                zoom=3.5
-            ),
-            margin=dict(l=0, r=0, t=0, b=0),
-            height=800,
-            hoverlabel=dict(namelength=-1)
-        )
+        # Only the marker arrays change with the filters - patch them into the existing figure
+        # instead of re-sending the whole figure and layout
+        markers = get_map_marker_data(filtered)
+        fig = Patch()
+        fig['data'][0]['lat'] = markers['lat']
+        fig['data'][0]['lon'] = markers['lon']
+        fig['data'][0]['text'] = markers['text']
+        fig['data'][0]['marker']['color'] = markers['marker_color']
+        fig['data'][0]['customdata'] = markers['customdata']
         
         print(f"Successfully created map with {len(filtered)} schools")
         return fig
@@ -1510,20 +1783,14 @@ def update_map(filter_state):
         print(f"Error in update_map: {e}")
         import traceback
         traceback.print_exc()
-        # Return empty map on error
-        return go.Figure(go.Scattermap(
-            lat=[39.8283],
-            lon=[-98.5795],
-            mode='markers',
-            marker=dict(size=0)
-        ))
+        # Return empty map on error (keeping the layout so later patches still apply)
+        return create_map_figure(merged_data.iloc[:0])
 
 # Handle map clicks: show info on single click, add to saved on double-click
 @app.callback(
     Output('map-school-info', 'children'),
     Output('saved-schools', 'data', allow_duplicate=True),
     Output('map-click-state', 'data'),
-    Output('map-selected-unitid', 'data'),
     Input('baseball-map', 'clickData'),
     State('saved-schools', 'data'),
     State('map-click-state', 'data'),
@@ -1532,11 +1799,11 @@ def update_map(filter_state):
 def handle_map_click(clickData, saved_schools, click_state):
     try:
         if not clickData or not clickData.get('points'):
-            return dash.no_update, dash.no_update, click_state, dash.no_update
+            return dash.no_update, dash.no_update, dash.no_update
         point = clickData['points'][0]
         custom = point.get('customdata')
         if custom is None or len(custom) == 0 or custom[0] is None:
-            return dash.no_update, dash.no_update, click_state, dash.no_update
+            return dash.no_update, dash.no_update, dash.no_update
         unitid = int(float(custom[0]))
         school_name = custom[1] if len(custom) > 1 else 'Unknown'
 
@@ -1557,22 +1824,16 @@ def handle_map_click(clickData, saved_schools, click_state):
                 dismissable=True,
                 duration=3000
             )
-            return info_card, updated, {'last_unitid': None, 'last_time': 0}, unitid
+            return info_card, updated, {'last_unitid': None, 'last_time': 0, 'selected_unitid': unitid}
         else:
             # Single click: show school info
-            school_data = merged_data[merged_data['unitid'] == unitid].iloc[0] if unitid in merged_data['unitid'].values else None
+            school_data = get_school_row(unitid) if unitid in UNITID_ROWS else None
             if school_data is not None:
-                def safe_int(val):
-                    try:
-                        return int(float(val))
-                    except Exception:
-                        return None
-
                 def fmt_int(val, suffix=''):
-                    v = safe_int(val)
+                    v = safe_int(val, default=None)
                     return f"{v}{suffix}" if v is not None else "N/A"
 
-                div_val = safe_int(school_data.get('division'))
+                div_val = safe_int(school_data.get('division'), default=None)
                 division_txt = f"D{div_val}" if div_val is not None else "N/A"
                 wins_txt = fmt_int(school_data.get('wins'))
                 losses_txt = fmt_int(school_data.get('losses'))
@@ -1642,23 +1903,24 @@ def handle_map_click(clickData, saved_schools, click_state):
             else:
                 info_card = None
             # Record first click
-            return info_card, dash.no_update, {'last_unitid': unitid, 'last_time': now}, unitid
+            return info_card, dash.no_update, {'last_unitid': unitid, 'last_time': now, 'selected_unitid': unitid}
     except Exception as e:
         print(f"Error handling map click: {e}")
         import traceback
         traceback.print_exc()
-        return dash.no_update, dash.no_update, click_state, dash.no_update
+        return dash.no_update, dash.no_update, dash.no_update
 
 # Add to saved via map info button
 @app.callback(
     Output('saved-schools', 'data', allow_duplicate=True),
     Input('map-add-to-saved', 'n_clicks'),
-    State('map-selected-unitid', 'data'),
+    State('map-click-state', 'data'),
     State('saved-schools', 'data'),
     prevent_initial_call=True
 )
-def add_map_selected_to_saved(n_clicks, unitid, saved_schools):
+def add_map_selected_to_saved(n_clicks, click_state, saved_schools):
     try:
+        unitid = (click_state or {}).get('selected_unitid')
         if not n_clicks or unitid is None:
             return dash.no_update
         updated = saved_schools[:] if saved_schools else []
@@ -1669,67 +1931,56 @@ def add_map_selected_to_saved(n_clicks, unitid, saved_schools):
         print(f"Error adding map selected to saved: {e}")
         return dash.no_update
 
-# Update filtered school list table
+# Update filtered school list rows when the filters change
 @app.callback(
-    Output('filtered-table', 'children'),
-    Output('filtered-data-store', 'data'),
-    Input('filter-state', 'data'),
-    Input('school-search', 'value')
+    Output('filtered-rows-store', 'data'),
+    Input('filter-state', 'data')
 )
-def update_filtered_table(filter_state, search_text):
+def update_filtered_table(filter_state):
     try:
-        if not filter_state:
-            filtered = merged_data.copy()
-        else:
-            filtered = filter_data_from_state(filter_state)
-        
-        # Apply search filter if search text provided
-        if search_text:
-            filtered = filtered[filtered['inst_name'].str.contains(search_text, case=False, na=False)]
-        
-        # Select columns to display
-        display_cols = ['inst_name', 'division', 'Conference_Name', 
-                       'wins', 'losses', 'win_pct', 'accept_rate_pct', 'ugds']
-        
-        # Only include columns that exist
-        display_cols = [col for col in display_cols if col in filtered.columns]
-        
-        # Add unitid for tracking selections
-        if 'unitid' not in display_cols:
-            display_cols = ['unitid'] + display_cols
-        
-        table_data = filtered[display_cols].copy()
-        
-        # Create DataTable with row selection and sorting
-        return dash_table.DataTable(
-            id='filtered-datatable',
-            columns=[
-                {'name': 'School', 'id': 'inst_name'},
-                {'name': 'Div', 'id': 'division'},
-                {'name': 'Conference', 'id': 'Conference_Name'},
-                {'name': 'W', 'id': 'wins'},
-                {'name': 'L', 'id': 'losses'},
-                {'name': 'Win%', 'id': 'win_pct'},
-                {'name': 'Accept%', 'id': 'accept_rate_pct'},
-                {'name': 'Enrollment', 'id': 'ugds'}
-            ],
-            data=table_data.to_dict('records'),
-            row_selectable='multi',
-            selected_rows=[],
-            sort_action='native',
-            style_table={'overflowX': 'auto', 'overflowY': 'auto', 'maxHeight': '600px'},
-            style_cell={'textAlign': 'left', 'padding': '5px'},
-            style_header={'backgroundColor': 'rgb(230, 230, 230)', 'fontWeight': 'bold'},
-            style_data_conditional=[{
-                'if': {'row_index': 'odd'},
-                'backgroundColor': 'rgb(248, 248, 248)'
-            }]
-        ), table_data.to_dict('records')
+        return get_filtered_records(json.dumps(filter_state or None, sort_keys=True))
     except Exception as e:
         print(f"Error in update_filtered_table: {e}")
         import traceback
         traceback.print_exc()
-        return html.Div("Error loading table"), []
+        return []
+
+# Columns shown in the filtered school list (unitid first, for tracking selections)
+TABLE_COLUMNS = ['unitid'] + [col for col in ['inst_name', 'division', 'Conference_Name',
+                                               'wins', 'losses', 'win_pct', 'accept_rate_pct', 'ugds']
+                              if col in merged_data.columns]
+# Those columns as plain arrays, indexed by row position (merged_data's index labels are positions)
+TABLE_COLUMN_ARRAYS = [merged_data[col].to_numpy() for col in TABLE_COLUMNS]
+
+@lru_cache(maxsize=16)
+def get_filtered_records(state_key):
+    """School list rows for a JSON-encoded filter state - callers must not modify the result"""
+    filter_state = json.loads(state_key)
+    filtered = filter_data_from_state(filter_state) if filter_state else merged_data
+    # Build the records column-wise from the precomputed arrays instead of through DataFrame.to_dict('records')
+    rows = filtered.index.to_numpy()
+    columns = [values[rows].tolist() for values in TABLE_COLUMN_ARRAYS]
+    return [dict(zip(TABLE_COLUMNS, values)) for values in zip(*columns)]
+
+# Apply the school name search in the browser so typing doesn't round-trip to the server
+# (clears the row selection, since row indexes change with the search)
+app.clientside_callback(
+    """
+    function(searchText, rows) {
+        rows = rows || [];
+        const query = (searchText || '').toLowerCase();
+        const matches = query
+            ? rows.filter(row => (row.inst_name || '').toLowerCase().includes(query))
+            : rows;
+        return [matches, matches, []];
+    }
+    """,
+    Output('filtered-datatable', 'data'),
+    Output('filtered-data-store', 'data'),
+    Output('filtered-datatable', 'selected_rows'),
+    Input('school-search', 'value'),
+    Input('filtered-rows-store', 'data')
+)
 
 # Add selected rows to saved list
 @app.callback(
@@ -1748,12 +1999,11 @@ def add_to_saved(n_clicks, selected_rows, table_data, saved_schools):
         # Get selected school unitids
         selected_unitids = [table_data[i]['unitid'] for i in selected_rows]
         
-        # Add to saved list (avoid duplicates)
-        saved_set = set(saved_schools or [])
-        saved_set.update(selected_unitids)
+        # Add to saved list (avoid duplicates, keep the order schools were saved in)
+        saved = list(dict.fromkeys((saved_schools or []) + selected_unitids))
         
-        print(f"Added {len(selected_unitids)} schools to saved list. Total saved: {len(saved_set)}")
-        return list(saved_set)
+        print(f"Added {len(selected_unitids)} schools to saved list. Total saved: {len(saved)}")
+        return saved
     except Exception as e:
         print(f"Error in add_to_saved: {e}")
         import traceback
@@ -1771,7 +2021,7 @@ def update_saved_table(saved_unitids):
             return html.Div("No schools saved yet. Use the Filtered School List tab to select and add schools.")
         
         # Get saved schools data
-        saved_data = merged_data[merged_data['unitid'].isin(saved_unitids)].copy()
+        saved_data = get_school_rows(saved_unitids)
         
         display_cols = ['unitid', 'inst_name', 'division', 'Conference_Name', 
                        'wins', 'losses', 'win_pct', 'accept_rate_pct', 'ugds']
@@ -1828,11 +2078,11 @@ def remove_from_saved(n_clicks, selected_rows, table_data, saved_schools):
         remove_unitids = [table_data[i]['unitid'] for i in selected_rows]
         
         # Remove from saved list
-        saved_set = set(saved_schools or [])
-        saved_set.difference_update(remove_unitids)
+        remove_set = set(remove_unitids)
+        saved = [u for u in (saved_schools or []) if u not in remove_set]
         
-        print(f"Removed {len(remove_unitids)} schools from saved list. Remaining: {len(saved_set)}")
-        return list(saved_set)
+        print(f"Removed {len(remove_unitids)} schools from saved list. Remaining: {len(saved)}")
+        return saved
     except Exception as e:
         print(f"Error in remove_from_saved: {e}")
         return saved_schools or []
@@ -1848,11 +2098,22 @@ def clear_saved(n_clicks):
     return []
 
 # Display roster metrics cards for saved schools
+# (built only while the Metrics tab is open, and only when the saved list has changed since)
 @app.callback(
     Output('roster-metrics', 'children'),
-    Input('saved-schools', 'data')
+    Output('roster-metrics-rendered', 'data'),
+    Input('saved-schools', 'data'),
+    Input('main-tabs', 'active_tab'),
+    State('roster-metrics-rendered', 'data')
 )
-def update_roster_metrics(saved_unitids):
+def update_roster_metrics(saved_unitids, active_tab, rendered_for):
+    saved_unitids = saved_unitids or []
+    if active_tab != 'tab-metrics' or rendered_for == saved_unitids:
+        return dash.no_update, dash.no_update
+    return build_roster_metrics(saved_unitids), saved_unitids
+
+def build_roster_metrics(saved_unitids):
+    """Build the roster metrics cards for the saved schools"""
     try:
         if not saved_unitids:
             return html.Div([
@@ -1862,18 +2123,28 @@ def update_roster_metrics(saved_unitids):
             ])
         
         # Get saved schools data
-        saved_schools_data = merged_data[merged_data['unitid'].isin(saved_unitids)].copy()
+        saved_schools_data = get_school_rows(saved_unitids)
+        
+        # Fetch scorecard data for all saved schools up front instead of one request per card
+        scorecard_by_unitid = fetch_college_scorecard_batch(saved_schools_data['unitid'].tolist())
+        
+        # Fill missing records once up front so each card can format them directly
+        saved_schools_data = saved_schools_data.assign(
+            wins=saved_schools_data['wins'].fillna(0).astype(int),
+            losses=saved_schools_data['losses'].fillna(0).astype(int),
+            win_pct=saved_schools_data['win_pct'].fillna(0)
+        )
         
         # Create cards for each school
         cards = []
-        for _, school in saved_schools_data.iterrows():
+        for school in saved_schools_data.to_dict('records'):
             ncaa_name = school.get('NCAA_name.x', None)
             logo_url = get_school_logo_url(school['inst_name'], ncaa_name)
             
             # Get school URL from scorecard API if available
             school_url = None
             try:
-                scorecard_data = fetch_college_scorecard_data(school['unitid'])
+                scorecard_data = scorecard_by_unitid.get(school['unitid'])
                 if scorecard_data:
                     school_url = scorecard_data.get('school', {}).get('school_url')
             except:
@@ -1924,7 +2195,7 @@ def update_roster_metrics(saved_unitids):
                     ]),
                     html.Div([
                         html.Strong("Record: "), 
-                        f"{int(school.get('wins', 0) if pd.notna(school.get('wins', 0)) else 0)}-{int(school.get('losses', 0) if pd.notna(school.get('losses', 0)) else 0)} ({school.get('win_pct', 0) if pd.notna(school.get('win_pct', 0)) else 0:.0f}%)"
+                        f"{school['wins']}-{school['losses']} ({school['win_pct']:.0f}%)"
                     ]),
                     html.Div([
                         html.Strong("Acceptance Rate: "), f"{school.get('accept_rate_pct', 0):.0f}%"
@@ -1976,10 +2247,10 @@ def toggle_metrics_modal(n_clicks, is_open):
             return is_open, "", None
         
         button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-        unitid = eval(button_id)['index']
+        unitid = json.loads(button_id)['index']
         
         # Get school data
-        school = merged_data[merged_data['unitid'] == unitid].iloc[0]
+        school = get_school_row(unitid)
         
         # Get roster data for this school
         school_roster = roster_data[roster_data['unitid'] == unitid] if 'unitid' in roster_data.columns else pd.DataFrame()
@@ -2049,61 +2320,7 @@ def toggle_metrics_modal(n_clicks, is_open):
                     html.H2(school_name_element, className="mb-3"),
                     html.P(f"{school.get('city', '')}, {school.get('state_abbr', '')}", className="text-muted mb-3"),
                     # School Info Badges (like College Scorecard)
-                    html.Div([
-                        # Year (fixed 4-year icon)
-                        html.Div([
-                            html.Div([html.Img(src="https://collegescorecard.ed.gov/school-icons/four.svg")], className='icon'),
-                            html.Div("Year", className='scorecard-label')
-                        ], className='scorecard-badge'),
-
-                        # Control/Ownership
-                        html.Div([
-                            html.Div([html.Img(src=("https://collegescorecard.ed.gov/school-icons/public.svg" if school.get('control') == 1.0 
-                                                     else "https://collegescorecard.ed.gov/school-icons/private.svg"))], className='icon'),
-                            html.Div(
-                                "Public" if school.get('control') == 1.0 else ("Private Nonprofit" if school.get('control') == 2.0 else "Private For-Profit"),
-                                className='scorecard-label'
-                            )
-                        ], className='scorecard-badge'),
-
-                        # Locale (City/Town/Rural)
-                        html.Div([
-                            html.Div([
-                                html.Img(src=(
-                                    "https://collegescorecard.ed.gov/school-icons/city.svg" if 11 <= school.get('locale', 0) <= 13 else (
-                                        "https://collegescorecard.ed.gov/school-icons/suburban.svg" if 21 <= school.get('locale', 0) <= 23 else (
-                                            "https://collegescorecard.ed.gov/school-icons/town.svg" if 31 <= school.get('locale', 0) <= 33 else
-                                            "https://collegescorecard.ed.gov/school-icons/rural.svg"
-                                        )
-                                    )
-                                ))
-                            ], className='icon'),
-                            html.Div(
-                                "City" if 11 <= school.get('locale', 0) <= 13 else (
-                                    "Suburb" if 21 <= school.get('locale', 0) <= 23 else (
-                                        "Town" if 31 <= school.get('locale', 0) <= 33 else "Rural"
-                                    )
-                                ),
-                                className='scorecard-label'
-                            )
-                        ], className='scorecard-badge'),
-
-                        # Size
-                        html.Div([
-                            html.Div([
-                                html.Img(src=(
-                                    "https://collegescorecard.ed.gov/school-icons/small.svg" if school.get('ugds', 0) < 2000 else (
-                                        "https://collegescorecard.ed.gov/school-icons/medium.svg" if school.get('ugds', 0) < 15000 else
-                                        "https://collegescorecard.ed.gov/school-icons/large.svg"
-                                    )
-                                ))
-                            ], className='icon'),
-                            html.Div(
-                                "Small" if school.get('ugds', 0) < 2000 else ("Medium" if school.get('ugds', 0) < 15000 else "Large"),
-                                className='scorecard-label'
-                            )
-                        ], className='scorecard-badge'),
-                    ], className="scorecard-badges mb-4")
+                    html.Div(get_scorecard_badges(school), className="scorecard-badges mb-4")
                 ], width=9),
                 dbc.Col([
                     html.Div([
@@ -2123,141 +2340,35 @@ def toggle_metrics_modal(n_clicks, is_open):
             # Athletic Stats Row
             html.H5("Athletic Performance", className="mb-3"),
             dbc.Row([
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.H6("Record", className="text-muted mb-2"),
-                            html.H3(f"{int(school.get('wins', 0) if pd.notna(school.get('wins', 0)) else 0)}-{int(school.get('losses', 0) if pd.notna(school.get('losses', 0)) else 0)}", className="mb-0")
-                        ])
-                    ], className="text-center")
-                ], width=3),
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.H6("Win %", className="text-muted mb-2"),
-                            html.H3(f"{school.get('win_pct', 0):.0f}%", className="mb-0")
-                        ])
-                    ], className="text-center")
-                ], width=3),
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.H6("Division", className="text-muted mb-2"),
-                            html.H3(f"{school.get('division', 'N/A')}", className="mb-0")
-                        ])
-                    ], className="text-center")
-                ], width=3),
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.H6("Roster Size", className="text-muted mb-2"),
-                            html.H3(f"{len(school_roster)}" if not school_roster.empty else "N/A", className="mb-0")
-                        ])
-                    ], className="text-center")
-                ], width=3)
+                make_metric_card("Record", f"{safe_int(school.get('wins'))}-{safe_int(school.get('losses'))}"),
+                make_metric_card("Win %", f"{school.get('win_pct', 0):.0f}%"),
+                make_metric_card("Division", f"{school.get('division', 'N/A')}"),
+                make_metric_card("Roster Size", f"{len(school_roster)}" if not school_roster.empty else "N/A")
             ], className="mb-4"),
             
             # Academic Stats Row
             html.H5("Academic Profile", className="mb-3 mt-4"),
             dbc.Row([
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.H6("Acceptance Rate", className="text-muted mb-2"),
-                            html.H3(f"{school.get('accept_rate_pct', 0):.0f}%", className="mb-0")
-                        ])
-                    ], className="text-center")
-                ], width=3),
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.H6("SAT Average", className="text-muted mb-2"),
-                            html.H3(f"{int(sat_avg)}" if sat_avg else "N/A", className="mb-0")
-                        ])
-                    ], className="text-center")
-                ], width=3),
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.H6("ACT Average", className="text-muted mb-2"),
-                            html.H3(f"{int(act_avg)}" if act_avg else "N/A", className="mb-0")
-                        ])
-                    ], className="text-center")
-                ], width=3),
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.H6("Enrollment", className="text-muted mb-2"),
-                            html.H3(f"{int(school.get('ugds', 0)):,}", className="mb-0")
-                        ])
-                    ], className="text-center")
-                ], width=3)
+                make_metric_card("Acceptance Rate", f"{school.get('accept_rate_pct', 0):.0f}%"),
+                make_metric_card("SAT Average", f"{int(sat_avg)}" if sat_avg else "N/A"),
+                make_metric_card("ACT Average", f"{int(act_avg)}" if act_avg else "N/A"),
+                make_metric_card("Enrollment", f"{int(school.get('ugds', 0)):,}")
             ], className="mb-4"),
             
             # Financial Information
             html.H5("Cost & Financial Aid", className="mb-3 mt-4"),
             dbc.Row([
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.H6("In-State Tuition", className="text-muted mb-2"),
-                            html.H4(format_currency(tuition_in_state), className="mb-0")
-                        ])
-                    ], className="text-center")
-                ], width=3),
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.H6("Out-of-State Tuition", className="text-muted mb-2"),
-                            html.H4(format_currency(tuition_out_state), className="mb-0")
-                        ])
-                    ], className="text-center")
-                ], width=3),
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.H6("Avg Net Price", className="text-muted mb-2"),
-                            html.H4(format_currency(net_price), className="mb-0")
-                        ])
-                    ], className="text-center")
-                ], width=3),
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.H6("Median Debt", className="text-muted mb-2"),
-                            html.H4(format_currency(median_debt), className="mb-0")
-                        ])
-                    ], className="text-center")
-                ], width=3)
+                make_metric_card(title, format_currency(value), heading=html.H4)
+                for title, value in [("In-State Tuition", tuition_in_state), ("Out-of-State Tuition", tuition_out_state),
+                                     ("Avg Net Price", net_price), ("Median Debt", median_debt)]
             ], className="mb-4"),
             
             # Outcomes
             html.H5("Student Outcomes", className="mb-3 mt-4"),
             dbc.Row([
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.H6("Retention Rate", className="text-muted mb-2"),
-                            html.H4(format_percentage(retention_rate), className="mb-0")
-                        ])
-                    ], className="text-center")
-                ], width=4),
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.H6("4-Year Completion", className="text-muted mb-2"),
-                            html.H4(format_percentage(completion_rate), className="mb-0")
-                        ])
-                    ], className="text-center")
-                ], width=4),
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.H6("Median Earnings (10yr)", className="text-muted mb-2"),
-                            html.H4(format_currency(median_earnings), className="mb-0")
-                        ])
-                    ], className="text-center")
-                ], width=4)
+                make_metric_card("Retention Rate", format_percentage(retention_rate), heading=html.H4, width=4),
+                make_metric_card("4-Year Completion", format_percentage(completion_rate), heading=html.H4, width=4),
+                make_metric_card("Median Earnings (10yr)", format_currency(median_earnings), heading=html.H4, width=4)
             ], className="mb-4")
             
         ], fluid=True)
@@ -2302,71 +2413,57 @@ def close_modal(n_clicks, is_open):
     Output('enrollment-filter', 'value'),
     Output('religious-filter', 'value'),
     Input('reset-filters', 'n_clicks'),
-    Input('conference-select-all', 'n_clicks'),
-    Input('conference-deselect-all', 'n_clicks'),
-    Input('religious-select-all', 'n_clicks'),
-    Input('religious-deselect-all', 'n_clicks'),
-    State('conference-filter', 'options'),
-    State('religious-filter', 'options'),
     prevent_initial_call=True
 )
-def reset_filters(reset_clicks, conf_select_all, conf_deselect_all, 
-                  relig_select_all, relig_deselect_all, conference_options, religious_options):
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        return dash.no_update
-    
-    button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    
-    if button_id == 'conference-select-all':
-        # Only update conference filter
-        return (dash.no_update, dash.no_update, dash.no_update, dash.no_update, 
-                dash.no_update, dash.no_update, dash.no_update, dash.no_update, 
-                dash.no_update, [opt['value'] for opt in conference_options], 
-                dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update,
-                dash.no_update, dash.no_update)
-    elif button_id == 'conference-deselect-all':
-        # Only update conference filter
-        return (dash.no_update, dash.no_update, dash.no_update, dash.no_update, 
-                dash.no_update, dash.no_update, dash.no_update, dash.no_update, 
-                dash.no_update, [], 
-                dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update,
-                dash.no_update, dash.no_update)
-    elif button_id == 'religious-select-all':
-        # Only update religious filter
-        return (dash.no_update, dash.no_update, dash.no_update, dash.no_update, 
-                dash.no_update, dash.no_update, dash.no_update, dash.no_update, 
-                dash.no_update, dash.no_update,
-                dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update,
-                dash.no_update, [opt['value'] for opt in religious_options])
-    elif button_id == 'religious-deselect-all':
-        # Only update religious filter
-        return (dash.no_update, dash.no_update, dash.no_update, dash.no_update, 
-                dash.no_update, dash.no_update, dash.no_update, dash.no_update, 
-                dash.no_update, dash.no_update,
-                dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update,
-                dash.no_update, [])
-    else:
-        # Reset all filters
-        return (
-            '21703',  # home-zip
-            2500,  # distance
-            1,  # clim-month (January)
-            [0, 100],  # temp
-            [0, 10],  # precip
-            [0, 100],  # cloud
-            REGIONS,  # regions
-            [1, 2, 3],  # divisions
-            [0, 100],  # win-pct
-            CONFERENCES,  # conferences
-            LOCALES,  # locales
-            list(CONTROL_MAP.keys()),  # control
-            [0, 100],  # accept-rate
-            [800, 1600],  # sat
-            [],  # usnews-ranked
-            ENROLLMENT_VALUES,  # enrollment
-            [NON_AFFILIATED] + RELIGIOUS_AFFILIATIONS,  # religious
-        )
+def reset_filters(reset_clicks):
+    # Reset all filters
+    return (
+        '21703',  # home-zip
+        2500,  # distance
+        1,  # clim-month (January)
+        [0, 100],  # temp
+        [0, 10],  # precip
+        [0, 100],  # cloud
+        REGIONS,  # regions
+        [1, 2, 3],  # divisions
+        [0, 100],  # win-pct
+        CONFERENCES,  # conferences
+        LOCALES,  # locales
+        list(CONTROL_MAP.keys()),  # control
+        [0, 100],  # accept-rate
+        [800, 1600],  # sat
+        [],  # usnews-ranked
+        ENROLLMENT_VALUES,  # enrollment
+        [NON_AFFILIATED] + RELIGIOUS_AFFILIATIONS,  # religious
+    )
+
+# Select/Deselect All for the conference and religious checklists, handled in the browser
+# (Select All picks the options currently shown, i.e. after any search)
+for checklist_id, select_all_id, deselect_all_id in [
+    ('conference-filter', 'conference-select-all', 'conference-deselect-all'),
+    ('religious-filter', 'religious-select-all', 'religious-deselect-all')
+]:
+    app.clientside_callback(
+        """
+        function(n_clicks, options) {
+            return (options || []).map(opt => opt.value);
+        }
+        """,
+        Output(checklist_id, 'value', allow_duplicate=True),
+        Input(select_all_id, 'n_clicks'),
+        State(checklist_id, 'options'),
+        prevent_initial_call=True
+    )
+    app.clientside_callback(
+        """
+        function(n_clicks) {
+            return [];
+        }
+        """,
+        Output(checklist_id, 'value', allow_duplicate=True),
+        Input(deselect_all_id, 'n_clicks'),
+        prevent_initial_call=True
+    )
 
 # Open team metrics modal
 @app.callback(
@@ -2392,7 +2489,7 @@ def toggle_team_metrics_modal(open_clicks, close_clicks, is_open, unitid):
     if button_id == 'open-team-metrics-btn' and unitid:
         try:
             # Get school data
-            school = merged_data[merged_data['unitid'] == unitid].iloc[0]
+            school = get_school_row(unitid)
             
             # Get logo
             ncaa_name = school.get('NCAA_name.x', '')
@@ -2420,12 +2517,8 @@ def toggle_team_metrics_modal(open_clicks, close_clicks, is_open, unitid):
             if pd.notna(prev_team_id):
                 try:
                     prev_team_id_int = int(float(prev_team_id))
-                    current_coach = coach_metrics[
-                        (coach_metrics['prev_team_id'] == prev_team_id_int) & 
-                        (coach_metrics['Year'] == 2026)
-                    ]
-                    if not current_coach.empty:
-                        coach_row = current_coach.iloc[0]
+                    coach_row = CURRENT_COACH_BY_TID.get(prev_team_id_int)
+                    if coach_row is not None:
                         coach_name = coach_row.get('Head_Coach', 'Unknown')
                         wins_at_team = coach_row.get('Wins_At_Team', 0)
                         losses_at_team = coach_row.get('Losses_At_Team', 0)
@@ -2436,10 +2529,10 @@ def toggle_team_metrics_modal(open_clicks, close_clicks, is_open, unitid):
                         
                         head_coach_info = {
                             'name': coach_name,
-                            'wins': int(wins_at_team) if pd.notna(wins_at_team) else 0,
-                            'losses': int(losses_at_team) if pd.notna(losses_at_team) else 0,
+                            'wins': safe_int(wins_at_team),
+                            'losses': safe_int(losses_at_team),
                             'win_pct': win_pct,
-                            'seasons': int(seasons_at_team) if pd.notna(seasons_at_team) else 0,
+                            'seasons': safe_int(seasons_at_team),
                             'url': coach_stats_url if pd.notna(coach_stats_url) and coach_stats_url else None
                         }
                 except Exception as e:
@@ -2603,7 +2696,8 @@ def toggle_team_metrics_modal(open_clicks, close_clicks, is_open, unitid):
                         dbc.Card([
                             dbc.CardBody([
                                 html.H6("Position Depth", className="mb-3"),
-                                calculate_position_depth_display(school)
+                                # Filled in by load_team_position_depth once the modal is showing
+                                dcc.Loading(html.Div(id='team-position-depth'), type='circle')
                             ])
                         ])
                     ], width=6)
@@ -2621,6 +2715,24 @@ def toggle_team_metrics_modal(open_clicks, close_clicks, is_open, unitid):
     
     return is_open, ""
 
+# Position depth needs the full roster file, which is loaded on first use - build it after the
+# team metrics modal has rendered so opening the modal doesn't wait on that load
+@app.callback(
+    Output('team-position-depth', 'children'),
+    Input('team-position-depth', 'id'),
+    State('current-school-unitid', 'data')
+)
+def load_team_position_depth(_, unitid):
+    try:
+        if not unitid:
+            return html.P("No roster data available", className="text-muted")
+        return calculate_position_depth_display(get_school_row(unitid))
+    except Exception as e:
+        print(f"Error loading position depth: {e}")
+        import traceback
+        traceback.print_exc()
+        return html.P("No roster data available", className="text-muted")
+
 # ============================================================================
 # FIREBASE AUTHENTICATION CALLBACKS
 # ============================================================================
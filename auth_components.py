@@ -6,6 +6,20 @@ Provides login, signup, and user profile UI components
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 
+# Badge colors for each school classification (shared across all badges)
+CLASSIFICATION_COLORS = {
+    "Target": "primary",
+    "Reach": "warning",
+    "Safety": "success"
+}
+
+# Pre-formatted icon classNames for each school classification
+CLASSIFICATION_ICON_CLASSES = {
+    "Target": "fas fa-bullseye me-1",
+    "Reach": "fas fa-rocket me-1",
+    "Safety": "fas fa-check-circle me-1"
+}
+
 def create_login_modal():
     """Create login/signup modal component"""
     return dbc.Modal([
@@ -220,20 +234,8 @@ def create_classification_badge(classification, fit_score=None):
     if not classification:
         return html.Span()
     
-    colors = {
-        "Target": "primary",
-        "Reach": "warning",
-        "Safety": "success"
-    }
-    
-    icons = {
-        "Target": "fas fa-bullseye",
-        "Reach": "fas fa-rocket",
-        "Safety": "fas fa-check-circle"
-    }
-    
     badge_content = [
-        html.I(className=f"{icons.get(classification, 'fas fa-tag')} me-1"),
+        html.I(className=CLASSIFICATION_ICON_CLASSES.get(classification, "fas fa-tag me-1")),
         classification
     ]
     
@@ -242,7 +244,7 @@ def create_classification_badge(classification, fit_score=None):
     
     return dbc.Badge(
         badge_content,
-        color=colors.get(classification, "secondary"),
+        color=CLASSIFICATION_COLORS.get(classification, "secondary"),
         className="ms-2",
         pill=True
     )